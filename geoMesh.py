@@ -1,11 +1,15 @@
 import argparse
 import json
 import os
-import trimesh
 import numpy as np
-from shapely.geometry import shape, Polygon, MultiPolygon
+
+# trimesh and shapely are imported lazily inside the functions below so that
+# the mesh server only pays for them once a GeoJSON conversion is requested.
 
 def extrude_feature_geometry(geometry, height, simplify_tolerance=None, use_z=False):
+    import trimesh
+    from shapely.geometry import shape, MultiPolygon
+
     # Separate out Z if needed
     def extract_xy_and_z(coords):
         if isinstance(coords[0][0], (float, int)):
@@ -60,6 +64,8 @@ def extrude_feature_geometry(geometry, height, simplify_tolerance=None, use_z=Fa
     return trimesh.util.concatenate(meshes)
 
 def apply_uv_mapping(mesh):
+    import trimesh
+
     vertices = mesh.vertices[:, :2]  # Use X and Y for UVs
     uvs = (vertices - vertices.min(axis=0)) / (np.ptp(vertices, axis=0) + 1e-6)
     uvs = np.clip(uvs, 0, 1)
@@ -67,12 +73,16 @@ def apply_uv_mapping(mesh):
     return mesh
 
 def apply_uv_mapping_old(mesh):
+    import trimesh
+
     vertices = mesh.vertices[:, :2]
     uvs = (vertices - vertices.min(axis=0)) / (vertices.ptp(axis=0) + 1e-6)
     mesh.visual = trimesh.visual.TextureVisuals(uv=uvs)
     return mesh
 
 def extrude_geojson_features(features, simplify_tolerance=None, use_z=False):
+    import trimesh
+
     all_meshes = []
     for feature in features:
         geometry = feature['geometry']
@@ -82,6 +92,18 @@ def extrude_geojson_features(features, simplify_tolerance=None, use_z=False):
         all_meshes.append(mesh)
     return trimesh.util.concatenate(all_meshes)
 
+def finalize_mesh(mesh, swap_yz=False, center=False):
+    if swap_yz:
+        mesh.vertices = mesh.vertices[:, [0, 2, 1]]
+        print("Swapped Y and Z axes for 3D map compatibility.")
+
+    if center:
+        center = mesh.bounding_box.centroid
+        mesh.apply_translation(-center)
+        print(f"Centered mesh to origin using bounding box center: {center}")
+
+    return mesh
+
 def main():
     parser = argparse.ArgumentParser(description="Extrude GeoJSON polygons to 3D with UV mapping.")
     parser.add_argument("input", help="Input GeoJSON file")
@@ -122,14 +144,7 @@ def main():
     print(f"Total vertices: {len(extruded.vertices)}")
     print(f"Total faces: {len(extruded.faces)}")
 
-    if args.swap_yz:
-        extruded.vertices = extruded.vertices[:, [0, 2, 1]]
-        print("Swapped Y and Z axes for 3D map compatibility.")
-
-    if args.center:
-        center = extruded.bounding_box.centroid
-        extruded.apply_translation(-center)
-        print(f"Centered mesh to origin using bounding box center: {center}")
+    extruded = finalize_mesh(extruded, swap_yz=args.swap_yz, center=args.center)
 
     output_path = os.path.splitext(input_path)[0] + ".glb"
     extruded.export(output_path)
@@ -1,9 +1,13 @@
 import os
-import requests
+import tempfile
 import mercantile
 from pyproj import Transformer
-from osgeo import ogr, osr
+from osgeo import gdal, ogr, osr
 import re
+from shapely import wkb
+from shapely.geometry import MultiLineString, MultiPoint, MultiPolygon, box, shape
+from shapely.ops import transform
+from shapely.prepared import prep
 
 
 # Coordinate conversion helper
@@ -17,6 +21,12 @@ def local_to_global(x_local, y_local,tile_bounds,extent):
 
     return x_world, y_world
 
+def global_to_local(x_world, y_world,tile_bounds,extent):
+    x0, y0, x1, y1 = tile_bounds.left, tile_bounds.bottom, tile_bounds.right, tile_bounds.top
+    x_local = (x_world - x0) * extent / (x1 - x0)
+    y_local = (y_world - y0) * extent / (y1 - y0)
+    return x_local, y_local
+
 # Transform geometry manually
 def transform_geometry_to_3857(geom,tile_bounds,extent):
     geom_type = geom.GetGeometryType()
@@ -102,140 +112,457 @@ radius_m = 3000  # in meters
 zoom = 15
 tile_url_template = "https://sgx.geodatenzentrum.de/gdz_basemapde_vektor/tiles/v2/bm_web_de_3857/{z}/{x}/{y}.pbf"
 keywords = ["Verkehr", "Siedlung", "Gebaeude", "Gebäude", "Bauwerk", "Gewaesser", "Adresse", "Name_"]
+tile_dir = "geojson_tiles"
+download_timeout = 30  # seconds
+extent = 4096.0  # MVT default
+# Optional query restrictions (see Query); None keeps everything
+aoi_lonlat = None  # GeoJSON-like polygon in EPSG:4326, replaces the radius square
+layer_allowlist = None  # exact layer names, replaces the keyword match
+properties = None  # attribute names to keep, e.g. ["hoehe"]
+where = None  # OGR SQL attribute filter, e.g. "hoehe > 10"
+
+
+def memory_driver():
+    # "Memory" was folded into "MEM" in GDAL 3.11
+    return ogr.GetDriverByName("Memory") or ogr.GetDriverByName("MEM")
+
+
+def attribute_filter_error(layer, where):
+    """Set an attribute filter; return GDAL's error message, or None on success."""
+    gdal.ErrorReset()
+    gdal.PushErrorHandler("CPLQuietErrorHandler")
+    try:
+        if layer.SetAttributeFilter(where) == 0:
+            return None
+        return gdal.GetLastErrorMsg() or "rejected"
+    except RuntimeError as e:  # with ogr.UseExceptions()
+        return str(e)
+    finally:
+        gdal.PopErrorHandler()
+
+
+def where_fields(where):
+    """Fields an OGR SQL filter refers to, mapped to a field type it accepts.
+
+    The names come from GDAL's own parser: the filter is compiled against an
+    empty scratch layer and each field GDAL reports as missing is added, first
+    as Real and, if the filter then fails to type-check, as String. Raises
+    ValueError for anything else GDAL rejects (syntax errors, unknown functions).
+    """
+    fields = {}
+    last = None
+    while True:
+        ds = memory_driver().CreateDataSource("where_check")
+        layer = ds.CreateLayer("where_check")
+        for name, field_type in fields.items():
+            layer.CreateField(ogr.FieldDefn(name, field_type))
+        error = attribute_filter_error(layer, where)
+        if error is None:
+            return fields
+        missing = re.search(r'"([^"]+)" not recognised as an available field', error)
+        if missing and missing.group(1) not in fields:
+            last = missing.group(1)
+            fields[last] = ogr.OFTReal
+        elif last is not None and fields[last] == ogr.OFTReal:
+            fields[last] = ogr.OFTString
+        else:
+            raise ValueError(f"Invalid attribute filter {where!r}: {error}")
+
+
+# Dimension of each geometry type, used to drop lower-dimension clipping debris
+geometry_dims = {"Point": 0, "MultiPoint": 0, "LineString": 1, "LinearRing": 1,
+                 "MultiLineString": 1, "Polygon": 2, "MultiPolygon": 2}
+
+
+def geometry_parts(g):
+    """Single-part geometries of g, flattening multi-geometries and collections."""
+    if hasattr(g, "geoms"):
+        for part in g.geoms:
+            yield from geometry_parts(part)
+    elif not g.is_empty:
+        yield g
+
+
+class Query:
+    """What to extract: an area of interest plus layer/attribute restrictions.
+
+    aoi is a shapely geometry in EPSG:3857. Layers are selected by the exact
+    names in `layers` if given, otherwise by the `keywords` regexes. Only the
+    attributes listed in `properties` are read (all if None), and `where` is an
+    OGR SQL attribute filter evaluated by GDAL on each tile layer. Features are
+    clipped to the AOI.
+    """
+
+    def __init__(self, aoi, layers=None, keywords=keywords, properties=None, where=None):
+        self.aoi = aoi
+        self.prepared_aoi = prep(aoi)
+        self.layers = set(layers) if layers else None
+        self.keyword_pattern = re.compile("|".join(f"(?:{k})" for k in keywords), re.IGNORECASE)
+        self.properties = {p.lower() for p in properties} if properties is not None else None
+        self.where = where
+        # fields the attribute filter refers to (lower-cased, as OGR SQL is
+        # case-insensitive) must still be read; raises on an invalid filter
+        self.where_fields = {name.lower(): field_type
+                             for name, field_type in where_fields(where).items()} if where else {}
+        self._layer_matches = {}
+        self._scratch_ds = None
+
+    @classmethod
+    def from_radius(cls, center_lat, center_lon, radius_m, **kwargs):
+        """Square of +/- radius_m (EPSG:3857) around the center."""
+        to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+        x_center, y_center = to_3857.transform(center_lon, center_lat)
+        aoi = box(x_center - radius_m, y_center - radius_m, x_center + radius_m, y_center + radius_m)
+        return cls(aoi, **kwargs)
+
+    @classmethod
+    def from_lonlat(cls, geometry, **kwargs):
+        """AOI given as a shapely geometry or GeoJSON-like dict in EPSG:4326."""
+        if isinstance(geometry, dict):
+            geometry = shape(geometry)
+        to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+        return cls(transform(to_3857.transform, geometry), **kwargs)
+
+    @classmethod
+    def from_bbox(cls, lon_min, lat_min, lon_max, lat_max, **kwargs):
+        return cls.from_lonlat(box(lon_min, lat_min, lon_max, lat_max), **kwargs)
+
+    def lonlat_bounds(self):
+        to_4326 = Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
+        x_min, y_min, x_max, y_max = self.aoi.bounds
+        lon_min, lat_min = to_4326.transform(x_min, y_min)
+        lon_max, lat_max = to_4326.transform(x_max, y_max)
+        return lon_min, lat_min, lon_max, lat_max
+
+    def tiles(self, zoom):
+        """Tiles at zoom that actually intersect the AOI (not just its bbox)."""
+        for tile in mercantile.tiles(*self.lonlat_bounds(), zoom):
+            b = mercantile.xy_bounds(tile)
+            if self.prepared_aoi.intersects(box(b.left, b.bottom, b.right, b.top)):
+                yield tile
+
+    def matches_layer(self, lname):
+        if lname not in self._layer_matches:
+            if self.layers is not None:
+                self._layer_matches[lname] = lname in self.layers
+            else:
+                self._layer_matches[lname] = bool(self.keyword_pattern.search(lname))
+        return self._layer_matches[lname]
+
+    def apply_filters(self, layer, tile_bounds, spatial=True):
+        """Push the query into an OGR tile layer; return the layer to read features from."""
+        if spatial:
+            # MVT features are in tile-local coordinates, so is the filter rect
+            b = self.aoi.bounds
+            x_min, y_min = global_to_local(b[0], b[1], tile_bounds, extent)
+            x_max, y_max = global_to_local(b[2], b[3], tile_bounds, extent)
+            layer.SetSpatialFilterRect(x_min, y_min, x_max, y_max)
+
+        defn = layer.GetLayerDefn()
+        names = [defn.GetFieldDefn(i).GetName() for i in range(defn.GetFieldCount())]
+        if self.properties is not None:
+            layer.SetIgnoredFields([n for n in names
+                                    if n.lower() not in self.properties
+                                    and n.lower() not in self.where_fields])
+
+        if self.where:
+            # MVT tiles only declare the attributes present in that tile, so a
+            # field of the filter may be missing; evaluate on a copy where it is NULL
+            present = {n.lower() for n in names}
+            missing = {n: t for n, t in self.where_fields.items() if n not in present}
+            if missing:
+                layer = self._with_null_fields(layer, missing)
+            error = attribute_filter_error(layer, self.where)
+            if error:
+                raise ValueError(f"Attribute filter {self.where!r} rejected by layer "
+                                 f"{layer.GetName()}: {error}")
+        return layer
+
+    def _with_null_fields(self, layer, missing):
+        """In-memory copy of the (spatially filtered) layer with extra NULL fields."""
+        self._scratch_ds = memory_driver().CreateDataSource("scratch")
+        copy = self._scratch_ds.CreateLayer(layer.GetName(), None, layer.GetGeomType())
+        defn = layer.GetLayerDefn()
+        for i in range(defn.GetFieldCount()):
+            copy.CreateField(defn.GetFieldDefn(i))
+        for name, field_type in missing.items():
+            copy.CreateField(ogr.FieldDefn(name, field_type))
+        copy_defn = copy.GetLayerDefn()
+        for feat in layer:
+            feat_copy = ogr.Feature(copy_defn)
+            feat_copy.SetFrom(feat)
+            copy.CreateFeature(feat_copy)
+        return copy
+
+    def field_names(self, feat):
+        if self.properties is None:
+            return feat.keys()
+        return [k for k in feat.keys() if k.lower() in self.properties]
+
+    def clip(self, geom):
+        """Clip an EPSG:3857 OGR geometry to the AOI; None if it lies outside."""
+        g = wkb.loads(bytes(geom.ExportToWkb()))
+        if self.prepared_aoi.contains(g):
+            return geom
+        if not self.prepared_aoi.intersects(g):
+            return None
+        # keep only parts of the input's dimension, e.g. drop the line left
+        # over where a polygon edge runs along the AOI boundary
+        dim = geometry_dims.get(g.geom_type)
+        parts = [p for p in geometry_parts(self.aoi.intersection(g))
+                 if geometry_dims.get(p.geom_type) == dim]
+        if not parts:
+            return None
+        if len(parts) == 1:
+            clipped = parts[0]
+        elif dim == 2:
+            clipped = MultiPolygon(parts)
+        elif dim == 1:
+            clipped = MultiLineString(parts)
+        else:
+            clipped = MultiPoint(parts)
+        return ogr.CreateGeometryFromWkb(clipped.wkb)
 
-# --- Prepare Output ---
-os.makedirs("geojson_tiles", exist_ok=True)
-
-# --- Transform center to EPSG:3857 ---
-to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-x_center, y_center = to_3857.transform(center_lon, center_lat)
-
-x_min = x_center - radius_m
-x_max = x_center + radius_m
-y_min = y_center - radius_m
-y_max = y_center + radius_m
-
-# --- Convert bounds back to lat/lon for tile selection ---
-to_4326 = Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
-lon_min, lat_min = to_4326.transform(x_min, y_min)
-lon_max, lat_max = to_4326.transform(x_max, y_max)
-
-tiles = list(mercantile.tiles(lon_min, lat_min, lon_max, lat_max, zoom))
-print(f"🔍 Selected {len(tiles)} tiles at zoom {zoom}")
-
-# --- Initialize collector ---
-merged_layer_dict = {}
 
-# --- Download and process each tile ---
-for tile in tiles:
+def fetch_tile(tile, tile_dir=tile_dir):
+    """Download a tile into tile_dir unless it is cached there; return its path or None."""
     x, y, z = tile.x, tile.y, tile.z
     url = tile_url_template.format(z=z, x=x, y=y)
-    tile_filename = f"geojson_tiles/tile_{z}_{x}_{y}.pbf"
+    tile_filename = f"{tile_dir}/tile_{z}_{x}_{y}.pbf"
 
-
-    # Assume this is inside the tile loop:
-    tile_bounds = mercantile.xy_bounds(x, y, z)
-    print("Bounds:",tile_bounds)
-    extent = 4096.0  # MVT default
-
-    # Download tile
     # Check if the file already exists
-    if not os.path.exists(tile_filename):
-        print(f"⬇️ Downloading {tile_filename}")
-        r = requests.get(url)
-        if r.status_code == 200:
-            with open(tile_filename, "wb") as f:
-                f.write(r.content)
-        else:
-            print(f"❌ Failed to download tile: {url}")
-            continue
-    else:  # If the file exists, skip downloading
-        print(f"✅ Tile already exists: {tile_filename}")   
+    if os.path.exists(tile_filename):
+        print(f"✅ Tile already exists: {tile_filename}")
+        return tile_filename
 
-    # Open tile with GDAL
-    ds = ogr.Open(f"MVT:{tile_filename}")
-    if not ds:
-        print(f"⚠️ Could not open tile: {tile_filename}")
-        continue
+    import requests  # only needed when a tile is not cached yet
 
-    for i in range(ds.GetLayerCount()):
-        layer = ds.GetLayer(i)
-        lname = layer.GetName()
+    print(f"⬇️ Downloading {tile_filename}")
+    try:
+        r = requests.get(url, timeout=download_timeout)
+    except requests.RequestException as e:
+        print(f"❌ Failed to download tile: {url} → {e}")
+        return None
+    if r.status_code != 200:
+        print(f"❌ Failed to download tile: {url}")
+        return None
 
-        if not any(re.search(k, lname, re.IGNORECASE) for k in keywords):
+    # Write to a temp file and rename it into place, so that other processes
+    # sharing the tile cache never see a partially written tile
+    fd, tmp_filename = tempfile.mkstemp(suffix=".part", dir=tile_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(r.content)
+        os.replace(tmp_filename, tile_filename)
+    except BaseException:
+        os.remove(tmp_filename)
+        raise
+    return tile_filename
+
+
+# Field types in widening order: a field only ever moves to the right.
+field_type_order = [ogr.OFTInteger, ogr.OFTInteger64, ogr.OFTReal, ogr.OFTString]
+
+
+def guess_field_type(value):
+    # bool is an int, so booleans are written as 0/1 Integer fields
+    if isinstance(value, int):
+        return ogr.OFTInteger if -2**31 <= value < 2**31 else ogr.OFTInteger64
+    if isinstance(value, float):
+        return ogr.OFTReal
+    return ogr.OFTString
+
+
+class LayerOutput:
+    """Output state of one layer while LayerSink is writing it."""
+
+    def __init__(self, ds, layer, path):
+        self.ds = ds
+        self.layer = layer
+        self.path = path
+        self.defn = ogr.FeatureDefn(layer.GetName())  # definition new features are built from
+        self.schema = {}  # field name -> inferred OGR field type
+        self.count = 0
+
+
+class LayerSink:
+    """Streams features into one <layer>_merged.geojson (EPSG:3857) per layer.
+
+    Each output is opened the first time its layer shows up. The field schema
+    is inferred while writing: unseen keys are added as new fields, and a field
+    whose values stop fitting its type is widened (Integer -> Integer64 -> Real
+    -> String). Features are handed in per tile and written as one batch, so
+    nothing is kept in memory beyond the tile being processed.
+    """
+
+    def __init__(self, out_dir="."):
+        self.out_dir = out_dir
+        self.driver = ogr.GetDriverByName("GeoJSON")
+        self.srs = osr.SpatialReference()
+        self.srs.ImportFromEPSG(3857)
+        self.layers = {}  # layer name -> LayerOutput
+        self.outputs = {}
+
+    def _open(self, lname):
+        out_path = os.path.join(self.out_dir, f"{lname}_merged.geojson")
+        output_ds = self.driver.CreateDataSource(out_path)
+        layer = output_ds.CreateLayer(lname, self.srs, ogr.wkbUnknown)
+        self.outputs[lname] = out_path
+        self.layers[lname] = LayerOutput(output_ds, layer, out_path)
+        print(f"🛠️ Writing {lname} to {out_path}")
+        return self.layers[lname]
+
+    def _update_schema(self, out, features):
+        widened = False
+        for feature in features:
+            for key, value in feature["properties"].items():
+                if value is None:
+                    continue
+                field_type = guess_field_type(value)
+                current = out.schema.get(key)
+                if current is None:
+                    # Late field addition: earlier features simply lack it
+                    out.schema[key] = field_type
+                    out.layer.CreateField(ogr.FieldDefn(key, field_type))
+                    out.defn.AddFieldDefn(ogr.FieldDefn(key, field_type))
+                elif field_type_order.index(field_type) > field_type_order.index(current):
+                    out.schema[key] = field_type
+                    widened = True
+
+        if widened:
+            # The GeoJSON driver cannot alter a field type once created, but
+            # GeoJSON has no declared schema either: the writer serialises each
+            # feature's attributes by that feature's own definition. So later
+            # features are built from a definition carrying the widened types
+            # (covered by tests/test_mapInit.py).
+            out.defn = ogr.FeatureDefn(out.layer.GetName())
+            for key, field_type in out.schema.items():
+                out.defn.AddFieldDefn(ogr.FieldDefn(key, field_type))
+
+    def write(self, lname, features):
+        """Write one batch (typically all features of a layer in one tile)."""
+        out = self.layers.get(lname) or self._open(lname)
+        self._update_schema(out, features)
+
+        for feature in features:
+            geom = feature["geometry"]
+            props = feature["properties"]
+            try:
+                if not geom.IsValid():
+                    geom = geom.Buffer(0)
+
+                if geom.IsValid():
+                    feat = ogr.Feature(out.defn)
+                    feat.SetGeometry(geom)
+
+                    # Set all attribute fields
+                    for key, value in props.items():
+                        if value is not None:
+                            feat.SetField(key, value)
+
+                    out.layer.CreateFeature(feat)
+                    feat = None
+                    out.count += 1
+            except Exception as e:
+                print(f"❌ Geometry write error: {e}")
+
+    def close(self):
+        """Flush and close all outputs; return {layer name: path}."""
+        for lname, out in self.layers.items():
+            # Dropping the last references closes the datasource and finishes the file
+            out.ds = out.layer = None
+            print(f"✅ Saved {out.path} with {out.count} features")
+        self.layers = {}
+        return self.outputs
+
+
+def stream_layers(tiles, sink, query, tile_dir=tile_dir):
+    """Read the layers selected by the query tile by tile and pass each tile's features to the sink."""
+    os.makedirs(tile_dir, exist_ok=True)
+
+    # --- Download and process each tile ---
+    for tile in tiles:
+        x, y, z = tile.x, tile.y, tile.z
+        tile_bounds = mercantile.xy_bounds(x, y, z)
+        print("Bounds:",tile_bounds)
+        # tiles completely inside the AOI need neither spatial filter nor clipping
+        inside = query.prepared_aoi.contains(
+            box(tile_bounds.left, tile_bounds.bottom, tile_bounds.right, tile_bounds.top))
+
+        tile_filename = fetch_tile(tile, tile_dir)
+        if tile_filename is None:
             continue
 
-        if lname not in merged_layer_dict:
-            merged_layer_dict[lname] = []
+        # Open tile with GDAL
+        ds = ogr.Open(f"MVT:{tile_filename}")
+        if not ds:
+            print(f"⚠️ Could not open tile: {tile_filename}")
+            continue
 
-        for feat in layer:
-            geom = feat.GetGeometryRef()
-            if geom:
-                try:
-                    if not geom.IsValid():
-                        geom = geom.Buffer(0)  # Try to fix
-
-                    transformed_geom = transform_geometry_to_3857(geom,tile_bounds,extent)
-
-                    if transformed_geom and transformed_geom.IsValid():
-                        merged_layer_dict[lname].append(
-                            {
-                                "properties": {k: feat.GetField(k) for k in feat.keys()},
-                                "geometry":transformed_geom
-                            }
-                        )
-                    else:
-                        print(f"⚠️ Invalid geometry in {tile_filename}, layer: {lname}")
-                except Exception as e:
-                    print(f"❌ Error reading geometry in {tile_filename}, layer: {lname} → {e}")
-
-# --- Output GeoJSONs (EPSG:3857) ---
-driver = ogr.GetDriverByName("GeoJSON")
-srs = osr.SpatialReference()
-srs.ImportFromEPSG(3857)
-
-for lname, features in merged_layer_dict.items():
-    print(f"🛠️ Writing {lname} with {len(features)} features...")
-    output_ds = driver.CreateDataSource(f"{lname}_merged.geojson")
-    layer = output_ds.CreateLayer(lname, srs, ogr.wkbUnknown)
-
-    # Build complete field schema from all features
-    all_keys = set()
-    for feat in features:
-        all_keys.update(feat["properties"].keys())
-
-    for key in all_keys:
-        # Guess field type from first non-None value
-        sample_value = next((f["properties"].get(key) for f in features if f["properties"].get(key) is not None), "")
-        if isinstance(sample_value, int):
-            field_type = ogr.OFTInteger
-        elif isinstance(sample_value, float):
-            field_type = ogr.OFTReal
-        else:
-            field_type = ogr.OFTString
-        field = ogr.FieldDefn(key, field_type)
-        layer.CreateField(field)
-
-    for feature in features:
-        geom = feature["geometry"]
-        props = feature["properties"]
-        try:
-            if not geom.IsValid():
-                geom = geom.Buffer(0)
-
-            if geom.IsValid():
-                feat = ogr.Feature(layer.GetLayerDefn())
-                feat.SetGeometry(geom)
-
-                # Set all attribute fields
-                for key, value in props.items():
-                    if value is not None:
-                        feat.SetField(key, value)
-
-                layer.CreateFeature(feat)
-                feat = None
-        except Exception as e:
-            print(f"❌ Geometry write error: {e}")
-
-    output_ds = None
-    print(f"✅ Saved {lname}_merged.geojson")
+        for i in range(ds.GetLayerCount()):
+            layer = ds.GetLayer(i)
+            lname = layer.GetName()
+
+            if not query.matches_layer(lname):
+                continue
+            layer = query.apply_filters(layer, tile_bounds, spatial=not inside)
+
+            features = []
+            for feat in layer:
+                geom = feat.GetGeometryRef()
+                if geom:
+                    try:
+                        if not geom.IsValid():
+                            geom = geom.Buffer(0)  # Try to fix
+
+                        transformed_geom = transform_geometry_to_3857(geom,tile_bounds,extent)
+                        if transformed_geom and not inside:
+                            transformed_geom = query.clip(transformed_geom)
+                            if transformed_geom is None:
+                                continue  # outside the AOI
+
+                        if transformed_geom and transformed_geom.IsValid():
+                            features.append(
+                                {
+                                    "properties": {k: feat.GetField(k) for k in query.field_names(feat)},
+                                    "geometry":transformed_geom
+                                }
+                            )
+                        else:
+                            print(f"⚠️ Invalid geometry in {tile_filename}, layer: {lname}")
+                    except Exception as e:
+                        print(f"❌ Error reading geometry in {tile_filename}, layer: {lname} → {e}")
+
+            if features:
+                sink.write(lname, features)
+
+        ds = None
+
+
+def export_query(query, zoom=zoom, tile_dir=tile_dir, out_dir="."):
+    """Export the features selected by the query as one merged GeoJSON per layer."""
+    tiles = list(query.tiles(zoom))
+    print(f"🔍 Selected {len(tiles)} tiles at zoom {zoom}")
+
+    sink = LayerSink(out_dir)
+    try:
+        stream_layers(tiles, sink, query, tile_dir)
+    finally:
+        outputs = sink.close()
+    return outputs
+
+
+def export_bbox(lon_min, lat_min, lon_max, lat_max, zoom=zoom, keywords=keywords,
+                tile_dir=tile_dir, out_dir=".", **query_args):
+    """Export all matching layers within a lon/lat bbox as merged GeoJSONs."""
+    query = Query.from_bbox(lon_min, lat_min, lon_max, lat_max, keywords=keywords, **query_args)
+    return export_query(query, zoom, tile_dir, out_dir)
+
+
+if __name__ == "__main__":
+    query_args = dict(layers=layer_allowlist, properties=properties, where=where)
+    if aoi_lonlat is not None:
+        query = Query.from_lonlat(aoi_lonlat, **query_args)
+    else:
+        query = Query.from_radius(center_lat, center_lon, radius_m, **query_args)
+    export_query(query)
@@ -0,0 +1,295 @@
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Long-running conversion service: keeps trimesh/shapely/svgpathtools/PIL/GDAL
+# and the texture images loaded in a pool of worker processes, so small
+# requests (e.g. from an interactive editor) do not pay the startup cost.
+#
+#   POST /svg?extrusion=1&max_size=10      body: SVG document      -> GLB bytes
+#   POST /geojson?simplify=0.5&center=1    body: GeoJSON          -> GLB bytes
+#   POST /bbox?bbox=lon_min,lat_min,lon_max,lat_max&layer=Gebaeudeflaeche -> GLB bytes
+#        (layer is an exact layer name)
+#        (optional where=<OGR SQL filter>, e.g. where=hoehe%3E10)
+#
+# Start it from the directory holding the textures (see textureGen.py).
+
+max_body_size = 64 * 1024 * 1024  # bytes accepted for an SVG/GeoJSON upload
+
+
+def _bool(value):
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _bbox(value):
+    bbox = [float(v) for v in value.split(",")]
+    if len(bbox) != 4:
+        raise ValueError("bbox must be lon_min,lat_min,lon_max,lat_max")
+    return bbox
+
+
+# Accepted query parameters per mode, with their type and default.
+# Defaults follow the command line defaults of svgMesh.py / geoMesh.py / mapInit.py.
+PARAMS = {
+    "svg": {
+        "extrusion": (float, 1.0),
+        "scale": (float, 1.0),
+        "tolerance": (float, 0.8),
+        "max_size": (float, 10.0),
+        "tile_scale": (float, 10),
+        "auto_close": (_bool, False),
+    },
+    "geojson": {
+        "simplify": (float, None),
+        "use_z": (_bool, False),
+        "swap_yz": (_bool, False),
+        "center": (_bool, False),
+    },
+    "bbox": {
+        "bbox": (_bbox, None),
+        "zoom": (int, 15),
+        "layer": (str, "Gebaeudeflaeche"),
+        "where": (str, None),
+        "simplify": (float, None),
+        "swap_yz": (_bool, False),
+        "center": (_bool, False),
+    },
+}
+
+
+def parse_params(mode, query):
+    params = {}
+    for name, (conv, default) in PARAMS[mode].items():
+        values = query.get(name)
+        params[name] = conv(values[-1]) if values else default
+    unknown = set(query) - set(PARAMS[mode])
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) for {mode}: {', '.join(sorted(unknown))}")
+    return params
+
+
+# --- Worker side (runs inside the pool processes) ---
+
+def warm_worker(modes):
+    """Pool initializer: import what the enabled modes need and preload textures."""
+    if "svg" in modes:
+        import svgMesh
+        for texture in svgMesh.textures:
+            if os.path.exists(texture):
+                svgMesh.load_texture(texture)
+        # pull in the lazily imported dependencies once, up front
+        import shapely.affinity, shapely.ops, svgpathtools, trimesh  # noqa: F401
+    if "geojson" in modes or "bbox" in modes:
+        import geoMesh  # noqa: F401
+        import shapely.geometry, trimesh  # noqa: F401
+    if "bbox" in modes:
+        import mapInit  # noqa: F401
+
+
+def convert_svg(svg_bytes, params):
+    import svgMesh
+
+    # svgpathtools wants a file name, so hand the document over via a temp file
+    fd, svg_file = tempfile.mkstemp(suffix=".svg")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(svg_bytes)
+        mesh = svgMesh.extrude_svg_with_textures(
+            svg_file=svg_file,
+            extrusion_height=params["extrusion"],
+            scale=params["scale"],
+            tolerance=params["tolerance"],
+            max_size=params["max_size"],
+            tile_scale=params["tile_scale"],
+            auto_close=params["auto_close"]
+        )
+    finally:
+        os.remove(svg_file)
+    return mesh.export(file_type="glb")
+
+
+def convert_geojson(geojson_bytes, params):
+    import geoMesh
+
+    features = json.loads(geojson_bytes).get("features", [])
+    mesh = geoMesh.extrude_geojson_features(features, params["simplify"], params["use_z"])
+    mesh = geoMesh.finalize_mesh(mesh, swap_yz=params["swap_yz"], center=params["center"])
+    return mesh.export(file_type="glb")
+
+
+def convert_bbox(params):
+    import geoMesh
+    import mapInit
+
+    if params["bbox"] is None:
+        raise ValueError("bbox parameter is required")
+
+    features = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        # tiles stay cached in mapInit.tile_dir across requests; geoMesh only
+        # needs the height attribute, so nothing else is read from the tiles
+        outputs = mapInit.export_bbox(*params["bbox"], zoom=params["zoom"],
+                                      layers=[params["layer"]], out_dir=out_dir,
+                                      properties=["hoehe"], where=params["where"])
+        for out_path in outputs.values():
+            with open(out_path) as f:
+                features.extend(
+                    feat for feat in json.load(f).get("features", [])
+                    if feat["geometry"]["type"] in ("Polygon", "MultiPolygon")
+                )
+    if not features:
+        raise ValueError(f"No polygon features found for layer {params['layer']}")
+
+    mesh = geoMesh.extrude_geojson_features(features, params["simplify"])
+    mesh = geoMesh.finalize_mesh(mesh, swap_yz=params["swap_yz"], center=params["center"])
+    return mesh.export(file_type="glb")
+
+
+# --- Server side ---
+
+def worker_ready():
+    return os.getpid()
+
+
+def make_pool(workers, modes):
+    """Start a worker pool and wait until every worker has run warm_worker."""
+    workers = workers or os.cpu_count() or 1
+    # forkserver: the pool is (re)built from handler threads, and forking a
+    # threaded process can deadlock
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=warm_worker,
+                               initargs=(tuple(modes),),
+                               mp_context=multiprocessing.get_context("forkserver"))
+    # Workers are started lazily on submit; submitting one no-op per worker
+    # before any of them is up spawns (and so warms) all of them now.
+    for future in [pool.submit(worker_ready) for _ in range(workers)]:
+        future.result()
+    return pool
+
+
+class MeshRequestHandler(BaseHTTPRequestHandler):
+    pool = None  # set by serve()
+    workers = None
+    modes = ()
+    pool_lock = threading.Lock()
+
+    @classmethod
+    def replace_pool(cls, broken):
+        """Swap a broken pool (a worker crashed or was killed) for a fresh one."""
+        with cls.pool_lock:
+            if cls.pool is broken:
+                print("⚠️ Worker pool broken, starting new workers")
+                cls.pool = make_pool(cls.workers, cls.modes)
+                broken.shutdown(wait=False)
+            return cls.pool
+
+    def submit(self, fn, *args):
+        """Submit to the current pool; return the pool used and the future."""
+        pool = self.pool
+        try:
+            return pool, pool.submit(fn, *args)
+        except BrokenProcessPool:
+            pool = self.replace_pool(pool)
+            return pool, pool.submit(fn, *args)
+
+    def read_body(self, required=True):
+        """Read the request body; on a bad or oversized one send the error and return None."""
+        length = self.headers.get("Content-Length")
+        if length is None:
+            if required:
+                self.send_error(411, explain="Content-Length required")
+                return None
+            return b""
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_error(400, explain="Invalid Content-Length")
+            return None
+        if length > max_body_size:
+            self.close_connection = True  # the unread body must not be parsed as a request
+            self.send_error(413, explain=f"Body larger than {max_body_size} bytes")
+            return None
+        return self.rfile.read(length)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        mode = url.path.strip("/")
+        if mode not in self.modes:
+            # details go into the (escaped) body, never into the status line
+            self.send_error(404, explain=f"Unknown mode: {mode}")
+            return
+
+        try:
+            params = parse_params(mode, parse_qs(url.query))
+        except ValueError as e:
+            self.send_error(400, explain=str(e))
+            return
+
+        body = self.read_body(required=mode != "bbox")
+        if body is None:
+            return
+        if mode == "svg":
+            pool, future = self.submit(convert_svg, body, params)
+        elif mode == "geojson":
+            pool, future = self.submit(convert_geojson, body, params)
+        else:
+            pool, future = self.submit(convert_bbox, params)
+
+        try:
+            glb = future.result()
+        except BrokenProcessPool:
+            self.replace_pool(pool)
+            self.send_error(503, explain="Worker crashed during conversion, please retry")
+            return
+        except ValueError as e:
+            self.send_error(400, explain=str(e))
+            return
+        except Exception as e:
+            self.send_error(500, explain=f"Conversion failed: {e}")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "model/gltf-binary")
+        self.send_header("Content-Length", str(len(glb)))
+        self.end_headers()
+        self.wfile.write(glb)
+
+
+def serve(host="127.0.0.1", port=8765, workers=None, modes=("svg", "geojson", "bbox")):
+    MeshRequestHandler.workers = workers
+    MeshRequestHandler.modes = tuple(modes)
+    MeshRequestHandler.pool = make_pool(workers, modes)
+    server = ThreadingHTTPServer((host, port), MeshRequestHandler)
+    print(f"🚀 Mesh server listening on http://{host}:{port} ({', '.join(modes)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        MeshRequestHandler.pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve SVG/GeoJSON/bbox to GLB conversions from warm workers")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address (localhost only by default)")
+    parser.add_argument("-p", "--port", type=int, default=8765, help="Port")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--modes", type=str, default="svg,geojson,bbox",
+                        help="Comma separated modes to enable; only their dependencies are loaded")
+    args = parser.parse_args()
+
+    modes = [m for m in args.modes.split(",") if m]
+    for m in modes:
+        if m not in PARAMS:
+            parser.error(f"Unknown mode: {m}")
+
+    serve(args.host, args.port, args.workers, modes)
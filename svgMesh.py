@@ -2,20 +2,22 @@
 
 import argparse
 import os
-import numpy as np
 import random
-import trimesh
-from PIL import Image
 import xml.etree.ElementTree as ET
-from svgpathtools import svg2paths2
-from svgpathtools import Path
-from shapely.geometry import Polygon, MultiPolygon
-from shapely.ops import unary_union
-from shapely.affinity import scale
-from trimesh.creation import extrude_polygon
+from functools import lru_cache
+
+import numpy as np
+
+# Heavy dependencies (trimesh, shapely, svgpathtools, PIL) are imported inside
+# the functions that need them, so that importing this module - e.g. from the
+# mesh server - stays cheap until a conversion is actually requested.
+
+textures = ["hatch1.png", "hatch2.png", "hatch3.png", "hatch4.png","red.png", "blue.png", "yellow.png"]
 
 
 def parse_svg_polygons(svg_file, scale=1.0, auto_close=False):
+    from shapely.geometry import Polygon
+
     tree = ET.parse(svg_file)
     root = tree.getroot()
     polygons = []
@@ -39,6 +41,9 @@ def parse_svg_polygons(svg_file, scale=1.0, auto_close=False):
 
 
 def svg_path_to_polygons(svg_paths, scale=1.0, auto_close=False, min_points=3):
+    from shapely.geometry import Polygon
+    from svgpathtools import Path
+
     polygons = []
 
     for path in svg_paths:
@@ -59,6 +64,8 @@ def svg_path_to_polygons(svg_paths, scale=1.0, auto_close=False, min_points=3):
 
 
 def close_polygon(points):
+    from shapely.geometry import Polygon
+
     if len(points) < 3:
         return None
     # If not already closed, append the first point to the end
@@ -72,6 +79,9 @@ def simplify_polygon(polygon, tolerance=0.5):
 
 
 def normalize_polygons(polygons, max_size=100.0):
+    from shapely.affinity import scale
+    from shapely.geometry import MultiPolygon
+
     combined = MultiPolygon(polygons)
     minx, miny, maxx, maxy = combined.bounds
     width = maxx - minx
@@ -84,8 +94,20 @@ def normalize_polygons(polygons, max_size=100.0):
     return scaled
 
 
-def apply_texture(mesh, image_path, tile_scale=10):
+@lru_cache(maxsize=None)
+def load_texture(image_path):
+    """Load a texture image once; repeated conversions reuse the decoded image."""
+    from PIL import Image
+
     image = Image.open(image_path).convert("RGBA")
+    image.load()
+    return image
+
+
+def apply_texture(mesh, image_path, tile_scale=10):
+    import trimesh
+
+    image = load_texture(image_path)
     uv = mesh.vertices[:, :2] * tile_scale
     uv = uv - uv.min(axis=0)
     uv = uv / uv.max(axis=0)
@@ -102,6 +124,12 @@ def extrude_svg_with_textures(
     tile_scale=10,
     auto_close=False
 ):
+    import trimesh
+    from shapely.geometry import Polygon
+    from shapely.ops import unary_union
+    from svgpathtools import svg2paths2
+    from trimesh.creation import extrude_polygon
+
     paths, _, _ = svg2paths2(svg_file)
     path_polys = svg_path_to_polygons(paths, scale, auto_close)
     polygon_elements = parse_svg_polygons(svg_file, scale, auto_close)
@@ -115,7 +143,6 @@ def extrude_svg_with_textures(
 
     all_polygons = normalize_polygons(simplified_polygons, max_size=max_size)
 
-    textures = ["hatch1.png", "hatch2.png", "hatch3.png", "hatch4.png","red.png", "blue.png", "yellow.png"]
     meshes = []
 
     for idx, poly in enumerate(all_polygons):
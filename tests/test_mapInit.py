@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("osgeo")
+pytest.importorskip("shapely")
+pytest.importorskip("mercantile")
+pytest.importorskip("pyproj")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import mapInit  # noqa: E402
+from osgeo import ogr  # noqa: E402
+
+
+def point_feature(x, y, **props):
+    geom = ogr.Geometry(ogr.wkbPoint)
+    geom.AddPoint(x, y)
+    return {"properties": props, "geometry": geom}
+
+
+def read_properties(path):
+    with open(path) as f:
+        return [feat["properties"] for feat in json.load(f)["features"]]
+
+
+def test_guess_field_type():
+    assert mapInit.guess_field_type(True) == ogr.OFTInteger
+    assert mapInit.guess_field_type(3) == ogr.OFTInteger
+    assert mapInit.guess_field_type(2**40) == ogr.OFTInteger64
+    assert mapInit.guess_field_type(2.5) == ogr.OFTReal
+    assert mapInit.guess_field_type("x") == ogr.OFTString
+
+
+def test_sink_widens_field_type_across_tiles(tmp_path):
+    sink = mapInit.LayerSink(str(tmp_path))
+    sink.write("L", [point_feature(0, 0, v=1)])
+    sink.write("L", [point_feature(1, 1, v=2.5)])
+    sink.write("L", [point_feature(2, 2, v="x")])
+    outputs = sink.close()
+
+    assert [p["v"] for p in read_properties(outputs["L"])] == [1, 2.5, "x"]
+
+
+def test_sink_adds_late_fields(tmp_path):
+    sink = mapInit.LayerSink(str(tmp_path))
+    sink.write("L", [point_feature(0, 0, a=1)])
+    sink.write("L", [point_feature(1, 1, a=2, b="late")])
+    outputs = sink.close()
+
+    first, second = read_properties(outputs["L"])
+    assert first["a"] == 1 and first.get("b") is None
+    assert second == {"a": 2, "b": "late"}
+
+
+def ogr_polygon(coords):
+    ring = ogr.Geometry(ogr.wkbLinearRing)
+    for x, y in coords + coords[:1]:
+        ring.AddPoint_2D(x, y)
+    poly = ogr.Geometry(ogr.wkbPolygon)
+    poly.AddGeometry(ring)
+    return poly
+
+
+def aoi_query(**kwargs):
+    from shapely.geometry import box
+    return mapInit.Query(box(0, 0, 10, 10), **kwargs)
+
+
+def test_clip_drops_boundary_line():
+    # the top band's lower edge runs along the AOI boundary at y=10
+    geom = ogr_polygon([(5, 1), (15, 1), (15, 12), (2, 12), (2, 10), (14, 10), (14, 3), (5, 3)])
+    clipped = aoi_query().clip(geom)
+    assert clipped.GetGeometryName() == "POLYGON"
+    assert clipped.GetArea() == pytest.approx(10.0)
+
+
+def test_clip_keeps_multipart_result():
+    geom = ogr_polygon([(2, 5), (4, 5), (4, 12), (6, 12), (6, 5), (8, 5), (8, 15), (2, 15)])
+    clipped = aoi_query().clip(geom)
+    assert clipped.GetGeometryName() == "MULTIPOLYGON"
+    assert clipped.GetGeometryCount() == 2
+
+
+def test_clip_outside_and_inside():
+    query = aoi_query()
+    assert query.clip(ogr_polygon([(20, 20), (30, 20), (30, 30)])) is None
+    inside = ogr_polygon([(1, 1), (2, 1), (2, 2)])
+    assert query.clip(inside).Equals(inside)
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("hoehe > 1e3", {"hoehe"}),
+    ("CAST(hoehe AS integer) > 3", {"hoehe"}),
+    ("lower(name) = 'x'", {"name"}),
+    ("name = 'Haus AND Hof' AND hoehe IS NOT NULL", {"name", "hoehe"}),
+    ("1 = 1", set()),
+])
+def test_where_fields(where, expected):
+    assert set(mapInit.where_fields(where)) == expected
+
+
+def test_where_fields_rejects_invalid_filter():
+    with pytest.raises(ValueError):
+        mapInit.where_fields("hoehe >")
+
+
+def memory_layer(fields, rows):
+    ds = mapInit.memory_driver().CreateDataSource("test")
+    layer = ds.CreateLayer("test", None, ogr.wkbPoint)
+    for name, field_type in fields.items():
+        layer.CreateField(ogr.FieldDefn(name, field_type))
+    for i, row in enumerate(rows):
+        feat = ogr.Feature(layer.GetLayerDefn())
+        geom = ogr.Geometry(ogr.wkbPoint)
+        geom.AddPoint_2D(i, i)
+        feat.SetGeometry(geom)
+        for key, value in row.items():
+            feat.SetField(key, value)
+        layer.CreateFeature(feat)
+    return ds, layer
+
+
+def filtered(query, layer):
+    layer = query.apply_filters(layer, None, spatial=False)
+    return [{k: feat.GetField(k) for k in query.field_names(feat)} for feat in layer]
+
+
+def test_where_field_missing_from_tile_is_null():
+    ds, layer = memory_layer({"klasse": ogr.OFTString}, [{"klasse": "Garage"}, {"klasse": "Haus"}])
+    query = aoi_query(where="hoehe > 10 OR klasse = 'Garage'")
+    assert [f["klasse"] for f in filtered(query, layer)] == ["Garage"]
+
+    ds, layer = memory_layer({"klasse": ogr.OFTString}, [{"klasse": "Garage"}, {"klasse": "Haus"}])
+    assert len(filtered(aoi_query(where="hoehe IS NULL"), layer)) == 2
+
+
+def test_where_field_case_survives_projection():
+    ds, layer = memory_layer({"hoehe": ogr.OFTReal, "x": ogr.OFTString},
+                             [{"hoehe": 5, "x": "low"}, {"hoehe": 20, "x": "high"}])
+    query = aoi_query(properties=["x"], where="HOEHE > 10")
+    assert filtered(query, layer) == [{"x": "high"}]